@@ -119,6 +119,12 @@ class TaskSubmitRequest(
     priority: int = Priority.MEDIUM
 
 
+class TaskBatchSubmitRequest(BaseRequestModel):
+    """Batch task submission request."""
+
+    tasks: List[TaskSubmitRequest] = Field(..., min_length=1, max_length=1000)
+
+
 class TaskFetchRequest(BaseRequestModel):
     worker_id: Optional[str] = None
     eta_max: Optional[str] = None
@@ -221,6 +227,10 @@ class TaskSubmitResponse(BaseResponseModel):
     task_id: str
 
 
+class TaskBatchSubmitResponse(BaseResponseModel):
+    task_ids: List[str]
+
+
 class TaskStatusUpdateRequest(BaseRequestModel):
     status: str = Field(..., pattern=r"^(success|failed|cancelled)$")
     worker_id: Optional[str] = None
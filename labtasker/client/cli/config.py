@@ -39,6 +39,8 @@ def config(
         )
         init_labtasker_root()
 
+    config_path = get_labtasker_client_config_path()
+
     # 1. Create a temporary file and prepare it for editing
     temp_file_path = None
     try:
@@ -48,7 +50,6 @@ def config(
         temp_file_path = Path(temp_file_path)  # type: ignore[assignment]
 
         # 1.1 Copy existing configuration to the temporary file (if it exists)
-        config_path = get_labtasker_client_config_path()
         if config_path.exists():
             with open(config_path, "rb") as existing_config, open(
                 temp_file_path, "wb"
@@ -91,5 +92,5 @@ def config(
 
     finally:
         # Cleanup: Delete the temporary file
-        if temp_file_path and temp_file_path.exists():  # type: ignore[attr-defined]
-            temp_file_path.unlink()  # type: ignore[attr-defined]
+        if temp_file_path is not None:
+            temp_file_path.unlink(missing_ok=True)  # type: ignore[attr-defined]
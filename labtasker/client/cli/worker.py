@@ -2,23 +2,12 @@
 Worker related CRUD operations.
 """
 
-import json
 from functools import partial
 from typing import Optional
 
 import click
 import typer
-from pydantic import ValidationError
-from starlette.status import HTTP_404_NOT_FOUND
-
-from labtasker.api_models import Worker
-from labtasker.client.core.api import (
-    create_worker,
-    delete_worker,
-    get_queue,
-    ls_workers,
-    report_worker_status,
-)
+
 from labtasker.client.core.cli_utils import (
     LsFmtChoices,
     cli_utils_decorator,
@@ -27,9 +16,12 @@ from labtasker.client.core.cli_utils import (
     parse_filter,
     parse_metadata,
 )
-from labtasker.client.core.exceptions import LabtaskerHTTPStatusError
 from labtasker.client.core.logging import set_verbose, stdout_console, verbose_print
 
+# Heavier imports (pydantic/starlette/api models) are deferred into the
+# command bodies that need them, so simple invocations like `--help` or an
+# unrelated subcommand don't pay their import cost at CLI startup.
+
 app = typer.Typer()
 
 
@@ -69,6 +61,8 @@ def create(
     """
     Create a new worker.
     """
+    from labtasker.client.core.api import create_worker
+
     metadata = parse_metadata(metadata)
     worker_id = create_worker(
         worker_name=worker_name,
@@ -138,6 +132,11 @@ def ls(
     """
     List workers.
     """
+    import json
+
+    from labtasker.api_models import Worker  # noqa: F401 (annotation below)
+    from labtasker.client.core.api import get_queue, ls_workers
+
     if quiet and (pager or verbose):
         raise typer.BadParameter("--quiet and --pager cannot be used together.")
 
@@ -189,6 +188,10 @@ def report(
     """
     Update the status of a worker. Can be used to revive crashed workers or manually suspend active workers.
     """
+    from pydantic import ValidationError
+
+    from labtasker.client.core.api import report_worker_status
+
     try:
         report_worker_status(worker_id=worker_id, status=status)
     except ValidationError as e:
@@ -209,6 +212,11 @@ def delete(
     """
     Delete a worker by worker_id.
     """
+    from starlette.status import HTTP_404_NOT_FOUND
+
+    from labtasker.client.core.api import delete_worker
+    from labtasker.client.core.exceptions import LabtaskerHTTPStatusError
+
     if not yes:
         typer.confirm(
             f"Are you sure you want to delete worker '{worker_id}'?",
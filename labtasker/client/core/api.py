@@ -9,6 +9,8 @@ from labtasker.api_models import (
     QueueCreateResponse,
     QueueGetResponse,
     QueueUpdateRequest,
+    TaskBatchSubmitRequest,
+    TaskBatchSubmitResponse,
     TaskFetchRequest,
     TaskFetchResponse,
     TaskLsRequest,
@@ -47,6 +49,7 @@ __all__ = [
     "get_queue",
     "delete_queue",
     "submit_task",
+    "submit_tasks",
     "fetch_task",
     "report_task_status",
     "refresh_task_heartbeat",
@@ -173,6 +176,22 @@ def submit_task(
     return TaskSubmitResponse(**response.json())
 
 
+@display_server_notifications
+@cast_http_status_error
+def submit_tasks(
+    tasks: List[TaskSubmitRequest],
+    client: Optional[httpx.Client] = None,
+) -> TaskBatchSubmitResponse:
+    """Submit multiple tasks to the queue in a single request."""
+    if client is None:
+        client = get_httpx_client()
+
+    payload = TaskBatchSubmitRequest(tasks=tasks).model_dump()
+    response = client.post("/api/v1/queues/me/tasks/batch", json=payload)
+    raise_for_status(response)
+    return TaskBatchSubmitResponse(**response.json())
+
+
 @display_server_notifications
 @cast_http_status_error
 def fetch_task(
@@ -333,7 +333,9 @@ def confirm(
 def ls_jsonl_format_iter(
     iterator: Iterable[BaseModel], exclude_unset: bool = False, use_rich: bool = True
 ):
-    console = Console()
+    # Console is only needed for ANSI capture; skip constructing it on the
+    # rich path where the renderable is yielded directly.
+    console = Console() if not use_rich else None
     for item in iterator:
         json_str = item.model_dump_json(indent=4, exclude_unset=exclude_unset) + "\n"
         if use_rich:
@@ -348,7 +350,7 @@ def ls_jsonl_format_iter(
 def ls_yaml_format_iter(
     iterator: Iterable[BaseModel], exclude_unset: bool = False, use_rich: bool = True
 ):
-    console = Console()
+    console = Console() if not use_rich else None
     for item in iterator:
         yaml_str = (
             yaml.dump(
@@ -394,6 +396,9 @@ def pager_iterator(
         for item in response.content:  # Adjust this based on the response structure
             yield item  # Yield each item
 
+        if len(response.content) < limit:
+            break  # Partial page means we hit the end; skip the trailing empty fetch
+
         offset += limit  # Increment offset for the next batch
 
 
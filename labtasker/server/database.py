@@ -1,8 +1,14 @@
-from typing import Any, Dict, List, Mapping, Optional, Union
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple, Union
 from uuid import uuid4
 
 from fastapi import HTTPException
-from pymongo import ASCENDING, DESCENDING, MongoClient
+from pymongo import ASCENDING, DESCENDING, IndexModel, MongoClient, UpdateOne
 from pymongo.collection import Collection, ReturnDocument
 from pymongo.database import Database
 from pymongo.errors import DuplicateKeyError
@@ -45,6 +51,203 @@ from labtasker.utils import (
 )
 
 
+def _new_id() -> str:
+    """Generate a random document id.
+
+    The 32-char hex form is preferred over str(uuid4()): no hyphen
+    formatting, fewer bytes on the wire and a more compact _id index.
+    """
+    return uuid4().hex
+
+
+@lru_cache(maxsize=None)
+def _get_mongo_client(uri: Optional[str]) -> MongoClient:
+    """Shared MongoClient per URI.
+
+    MongoClient owns a connection pool and monitoring threads; constructing
+    one per DBService would duplicate both. pymongo clients are thread-safe,
+    so all services for the same URI can share a single client.
+
+    Pool sizing: endpoints run synchronously in Starlette's threadpool
+    (~40 threads by default), so the pool ceiling is raised to match peak
+    request concurrency instead of pymongo's default 100-with-0-minimum;
+    keeping a few connections warm avoids reconnect latency after idle
+    periods.
+    """
+    return MongoClient(
+        uri,
+        w="majority",
+        retryWrites=True,
+        maxPoolSize=200,
+        minPoolSize=4,
+        maxIdleTimeMS=120_000,
+        # Network compression, best-first; pymongo skips algorithms whose
+        # packages are absent and falls back to uncompressed if none match
+        # what the server offers.
+        compressors="zstd,snappy,zlib",
+    )
+
+
+# Queue docs rarely change compared to how often they are resolved by name
+# (every authenticated request). Cached entries are invalidated on queue
+# update/deletion; the TTL bounds staleness for out-of-band modifications.
+_QUEUE_CACHE_TTL = 60.0  # seconds
+
+# Worker status is checked on every fetch, but a worker flapping between
+# active and suspended/crashed within a few seconds is not a supported
+# pattern; a short TTL absorbs the per-fetch lookup for busy workers while
+# explicit invalidation covers status reports and deletion.
+_WORKER_STATUS_CACHE_TTL = 5.0  # seconds
+
+# Upper bound on concurrent worker status reports during a timeout sweep;
+# the pool never grows past the number of distinct failed workers.
+_TIMEOUT_REPORT_CONCURRENCY = 16
+
+# Scalar defaults shared by every new task/worker document. Mutable fields
+# (metadata, args, summary) and per-call values are filled in at build time
+# so documents never alias these templates.
+_TASK_TEMPLATE: Dict[str, Any] = {
+    "task_name": None,
+    "start_time": None,
+    "last_heartbeat": None,
+    "heartbeat_timeout": None,
+    "task_timeout": None,
+    # Precomputed epoch-second deadlines, derived from the timeouts at
+    # claim/heartbeat time so the timeout sweep is a plain range query
+    # instead of per-document date arithmetic.
+    "heartbeat_deadline": None,
+    "task_deadline": None,
+    "max_retries": 3,
+    "retries": 0,
+    "priority": Priority.MEDIUM,
+    "cmd": "",
+    "worker_id": None,
+    # Token identifying the fetch_tasks call that claimed the task
+    "claim_id": None,
+}
+
+_WORKER_TEMPLATE: Dict[str, Any] = {
+    "worker_name": None,
+    "retries": 0,
+    "max_retries": 3,
+}
+
+# Shared query fragments, hoisted so hot paths don't rebuild them per call.
+_QUEUE_PROJECTION = {"password": 0}
+
+# sort: highest priority, least recently modified, oldest created
+_FETCH_SORT = [
+    ("priority", -1),
+    ("last_modified", 1),
+    ("created_at", 1),
+]
+
+
+# Epoch reference for converting stored datetimes to epoch seconds inside
+# aggregation expressions. Naive, like every datetime this codebase stores.
+_EPOCH = datetime.utcfromtimestamp(0)
+
+
+def _deadline_expr(now_ts: float, timeout_field: str) -> Dict[str, Any]:
+    """Aggregation expression: now plus the document's timeout, or None."""
+    return {
+        "$cond": [
+            {"$ne": [timeout_field, None]},
+            {"$add": [now_ts, timeout_field]},
+            None,
+        ]
+    }
+
+
+def _anchored_deadline_expr(anchor_field: str, timeout_field: str) -> Dict[str, Any]:
+    """Aggregation expression: stored anchor timestamp plus timeout, or None.
+
+    Like _deadline_expr, but anchored on a datetime already stored on the
+    document (last_heartbeat/start_time) instead of the current instant;
+    used to backfill deadlines on documents claimed before the deadline
+    fields existed.
+    """
+    return {
+        "$cond": [
+            {
+                "$and": [
+                    {"$ne": [anchor_field, None]},
+                    {"$ne": [timeout_field, None]},
+                ]
+            },
+            {
+                "$add": [
+                    {"$divide": [{"$subtract": [anchor_field, _EPOCH]}, 1000]},
+                    timeout_field,
+                ]
+            },
+            None,
+        ]
+    }
+
+
+def _claim_update(
+    now: datetime,
+    worker_id: Optional[str],
+    start_heartbeat: bool,
+    task_timeout: Optional[int],
+    heartbeat_timeout: Optional[float],
+) -> List[Dict[str, Any]]:
+    """Build the update that claims a PENDING task for execution.
+
+    Returned as a pipeline (rather than a plain ``$set``) so the deadline
+    fields can be derived from the timeouts already stored on the document
+    when no per-call override is supplied.
+    """
+    now_ts = now.timestamp()
+    set_fields: Dict[str, Any] = {
+        "status": TaskState.RUNNING.value,
+        "start_time": now,
+        "last_heartbeat": now if start_heartbeat else None,
+        "last_modified": now,
+        "worker_id": worker_id,
+    }
+
+    if task_timeout:
+        set_fields["task_timeout"] = task_timeout
+        set_fields["task_deadline"] = now_ts + task_timeout
+    else:
+        set_fields["task_deadline"] = _deadline_expr(now_ts, "$task_timeout")
+
+    if heartbeat_timeout:
+        set_fields["heartbeat_timeout"] = heartbeat_timeout
+
+    if not start_heartbeat:
+        set_fields["heartbeat_deadline"] = None
+    elif heartbeat_timeout:
+        set_fields["heartbeat_deadline"] = now_ts + heartbeat_timeout
+    else:
+        set_fields["heartbeat_deadline"] = _deadline_expr(now_ts, "$heartbeat_timeout")
+
+    return [{"$set": set_fields}]
+
+
+def _heartbeat_update(now: datetime) -> List[Dict[str, Any]]:
+    """Pipeline update refreshing last_heartbeat and its derived deadline."""
+    return [
+        {
+            "$set": {
+                "last_heartbeat": now,
+                "heartbeat_deadline": _deadline_expr(
+                    now.timestamp(), "$heartbeat_timeout"
+                ),
+            }
+        }
+    ]
+
+
+# (id(client), db_name) pairs whose indexes have been ensured. Index creation
+# is idempotent but still a server round-trip per index; services built on an
+# already-initialized client/database skip it. weakref.finalize drops the key
+# when the client is garbage collected so a reused id() cannot false-positive.
+_initialized_databases: Set[Tuple[int, str]] = set()
+
+
 class DBService:
 
     def __init__(
@@ -57,6 +260,15 @@ class DBService:
         Initialize database client. If client is provided, it will be used instead of connecting to MongoDB.
         The instances of this class is stateless. The instance itself does not preserve any state across API calls.
         """
+        # keyed by ("name", queue_name) / ("id", queue_id)
+        self._queue_cache: Dict[Tuple[str, str], Tuple[float, Mapping[str, Any]]] = {}
+        self._queue_cache_lock = threading.Lock()
+        # worker_id -> (cached_at, queue_id, status)
+        self._worker_status_cache: Dict[str, Tuple[float, str, str]] = {}
+        self._worker_status_cache_lock = threading.Lock()
+        # Single-flight guard for handle_timeouts; see its docstring.
+        self._timeout_sweep_lock = threading.Lock()
+
         if client:
             self._client = client
             self._db = self._client[db_name]
@@ -64,7 +276,7 @@ class DBService:
             return
 
         try:
-            self._client = MongoClient(uri, w="majority", retryWrites=True)
+            self._client = _get_mongo_client(uri)
             self._client.admin.command("ping")
             self._db: Database = self._client[db_name]  # type: ignore
             self._setup_collections()
@@ -79,34 +291,133 @@ class DBService:
         return True
 
     def is_empty(self):
+        # Metadata-backed counts instead of count_documents({}) collection
+        # scans; the and-chain short-circuits on the first non-empty
+        # collection.
         return (
-            self._queues.count_documents({}) == 0
-            and self._tasks.count_documents({}) == 0
-            and self._workers.count_documents({}) == 0
+            self._queues.estimated_document_count() == 0
+            and self._tasks.estimated_document_count() == 0
+            and self._workers.estimated_document_count() == 0
         )
 
     def _setup_collections(self):
-        """Setup collections and indexes."""
-        # Queues collection
+        """Setup collections and ensure indexes (once per client/database)."""
+        # _id is automatically indexed by MongoDB on every collection
         self._queues: Collection = self._db.queues
-        # _id is automatically indexed by MongoDB
-        self._queues.create_index([("queue_name", ASCENDING)], unique=True)
-
-        # Tasks collection
         self._tasks: Collection = self._db.tasks
-        # _id is automatically indexed by MongoDB
-        self._tasks.create_index([("queue_id", ASCENDING)])  # Reference to queue._id
-        self._tasks.create_index([("status", ASCENDING)])
-        self._tasks.create_index([("priority", DESCENDING)])  # Higher priority first
-        self._tasks.create_index([("created_at", ASCENDING)])  # Older tasks first
-
-        # Workers collection
         self._workers: Collection = self._db.workers
-        # _id is automatically indexed by MongoDB
-        self._workers.create_index([("queue_id", ASCENDING)])  # Reference to queue._id
-        self._workers.create_index(
-            [("worker_name", ASCENDING)]
-        )  # Optional index for searching
+        # Name -> collection registry for the generic query/update APIs;
+        # doubles as the whitelist of externally addressable collections.
+        self._collections: Dict[str, Collection] = {
+            "queues": self._queues,
+            "tasks": self._tasks,
+            "workers": self._workers,
+        }
+
+        key = (id(self._client), self._db.name)
+        if key in _initialized_databases:
+            return
+        _initialized_databases.add(key)
+        weakref.finalize(self._client, _initialized_databases.discard, key)
+
+        self._queues.create_indexes(
+            [IndexModel([("queue_name", ASCENDING)], unique=True)]
+        )
+
+        self._tasks.create_indexes(
+            [
+                # Equality-Sort-Range index matching the fetch_task predicate
+                # (queue_id + status equality) followed by the full fetch sort
+                # (priority desc, last_modified asc, created_at asc), so the
+                # next dispatchable task is found by walking the index instead
+                # of an in-memory sort. Also covers plain queue_id lookups via
+                # its prefix.
+                IndexModel(
+                    [
+                        ("queue_id", ASCENDING),
+                        ("status", ASCENDING),
+                        ("priority", DESCENDING),  # Higher priority first
+                        ("last_modified", ASCENDING),  # Least recently touched
+                        ("created_at", ASCENDING),  # Older tasks first
+                    ],
+                    name="fetch_task_esr",
+                ),
+                IndexModel([("status", ASCENDING)]),  # timeout scans
+                # Partial index restricted to dispatchable tasks. In mature
+                # queues the vast majority of documents are terminal
+                # (success/failed/cancelled); keeping only created/pending
+                # entries makes the index small enough to stay resident and
+                # cheap to maintain on the fetch hot path.
+                IndexModel(
+                    [
+                        ("queue_id", ASCENDING),
+                        ("priority", DESCENDING),
+                        ("last_modified", ASCENDING),
+                        ("created_at", ASCENDING),
+                    ],
+                    name="active_tasks_idx",
+                    partialFilterExpression={
+                        "status": {
+                            "$in": [TaskState.CREATED.value, TaskState.PENDING.value]
+                        }
+                    },
+                ),
+                # Timeout sweeps only ever look at running tasks and match a
+                # range over one of the precomputed deadlines; a pair of
+                # partial indexes (one per $or branch) lets the sweep walk
+                # just the expired running tasks and keeps the terminal-task
+                # majority out of the index entirely.
+                IndexModel(
+                    [("status", ASCENDING), ("heartbeat_deadline", ASCENDING)],
+                    name="ix_running_hb_deadline",
+                    partialFilterExpression={"status": TaskState.RUNNING.value},
+                ),
+                IndexModel(
+                    [("status", ASCENDING), ("task_deadline", ASCENDING)],
+                    name="ix_running_task_deadline",
+                    partialFilterExpression={"status": TaskState.RUNNING.value},
+                ),
+            ]
+        )
+
+        self._workers.create_indexes(
+            [
+                IndexModel([("queue_id", ASCENDING)]),  # Reference to queue._id
+                IndexModel(
+                    [("worker_name", ASCENDING)]
+                ),  # Optional index for searching
+            ]
+        )
+
+        self._backfill_task_deadlines()
+
+    def _backfill_task_deadlines(self) -> None:
+        """Backfill deadline fields on tasks claimed before they existed.
+
+        The timeout sweep only matches documents whose deadlines are set.
+        Running tasks written by an older version would otherwise never be
+        swept — their deadlines are normally derived at claim/heartbeat
+        time, and a dead worker never heartbeats — so derive them once from
+        the stored last_heartbeat/start_time and timeouts.
+        """
+        self._tasks.update_many(
+            {
+                "status": TaskState.RUNNING.value,
+                "heartbeat_deadline": {"$exists": False},
+            },
+            [
+                {
+                    "$set": {
+                        "heartbeat_deadline": _anchored_deadline_expr(
+                            "$last_heartbeat", "$heartbeat_timeout"
+                        ),
+                        "task_deadline": _anchored_deadline_expr(
+                            "$start_time", "$task_timeout"
+                        ),
+                    }
+                }
+            ],
+        )
 
     def close(self):
         """Close the database client."""
@@ -117,10 +428,50 @@ class DBService:
         self._queues.delete_many({})
         self._tasks.delete_many({})
         self._workers.delete_many({})
+        with self._queue_cache_lock:
+            self._queue_cache.clear()
+        self._worker_status_cache_invalidate()
+
+    def _queue_cache_get(self, key: Tuple[str, str]) -> Optional[Mapping[str, Any]]:
+        """Get a cached queue doc, or None if absent/expired.
+
+        Keys are ("name", queue_name) or ("id", queue_id) tuples so that
+        both lookup flavors share one cache and one invalidation path.
+        """
+        with self._queue_cache_lock:
+            entry = self._queue_cache.get(key)
+            if entry is None:
+                return None
+            cached_at, queue = entry
+            if time.monotonic() - cached_at > _QUEUE_CACHE_TTL:
+                del self._queue_cache[key]
+                return None
+            return queue
+
+    def _queue_cache_put(self, queue: Mapping[str, Any]) -> None:
+        """Cache a queue doc under both its name and id keys."""
+        with self._queue_cache_lock:
+            stamped = (time.monotonic(), queue)
+            self._queue_cache[("name", queue["queue_name"])] = stamped
+            self._queue_cache[("id", queue["_id"])] = stamped
+
+    def _queue_cache_invalidate(self, queue_id: Optional[str] = None) -> None:
+        """Drop cached entries for a queue (all entries if queue_id is None)."""
+        with self._queue_cache_lock:
+            if queue_id is None:
+                self._queue_cache.clear()
+                return
+            stale = [
+                key
+                for key, (_, queue) in self._queue_cache.items()
+                if queue["_id"] == queue_id
+            ]
+            for key in stale:
+                del self._queue_cache[key]
 
     @property
     def projection(self):
-        return {"password": 0}
+        return _QUEUE_PROJECTION
 
     @retry_on_transient
     @validate_arg
@@ -133,25 +484,21 @@ class DBService:
         offset: int = 0,
     ) -> List[Dict[str, Any]]:
         """Query a collection."""
-        with self._client.start_session() as session:
-            with session.start_transaction():
-                if collection_name not in ["queues", "tasks", "workers"]:
-                    raise HTTPException(
-                        status_code=HTTP_400_BAD_REQUEST,
-                        detail="Invalid collection name. Must be one of: queues, tasks, workers",
-                    )
+        # Read-only and served by a single cursor, so it needs no
+        # session/transaction: each batch is individually consistent.
+        collection = self._collections.get(collection_name)
+        if collection is None:
+            raise HTTPException(
+                status_code=HTTP_400_BAD_REQUEST,
+                detail="Invalid collection name. Must be one of: queues, tasks, workers",
+            )
 
-                # Prevent query injection
-                query = sanitize_query(queue_id, query)
+        # Prevent query injection
+        query = sanitize_query(queue_id, query)
 
-                result = (
-                    self._db[collection_name]
-                    .find(query, self.projection, session=session)
-                    .skip(offset)
-                    .limit(limit)
-                )
+        result = collection.find(query, self.projection).skip(offset).limit(limit)
 
-                return list(result)
+        return list(result)
 
     @risky("Potential query injection")
     @retry_on_transient
@@ -166,7 +513,8 @@ class DBService:
         """Update a collection. Return modified count"""
         with self._client.start_session() as session:
             with session.start_transaction():
-                if collection_name not in ["queues", "tasks", "workers"]:
+                collection = self._collections.get(collection_name)
+                if collection is None:
                     raise HTTPException(
                         status_code=HTTP_400_BAD_REQUEST,
                         detail="Invalid collection name. Must be one of: queues, tasks, workers",
@@ -186,9 +534,7 @@ class DBService:
                 else:
                     update["$set"] = {"last_modified": now}
 
-                result = self._db[collection_name].update_many(
-                    query, update, session=session
-                )
+                result = collection.update_many(query, update, session=session)
                 return result.modified_count
 
     @retry_on_transient
@@ -196,33 +542,97 @@ class DBService:
     def create_queue(
         self,
         queue_name: str,
-        password: str,
+        password: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        password_hash: Optional[str] = None,
     ) -> str:
-        """Create a new queue."""
+        """Create a new queue.
+
+        Either the plain password or a pre-computed password_hash must be
+        provided. Callers that can afford it (e.g. async endpoints) should
+        hash up front so the KDF work happens off the request path here.
+        """
         if not queue_name:
             raise HTTPException(
                 status_code=HTTP_400_BAD_REQUEST, detail="Queue name is required"
             )
-        with self._client.start_session() as session:
-            with session.start_transaction():
-                try:
-                    now = get_current_time()
-                    queue = {
-                        "_id": str(uuid4()),
-                        "queue_name": queue_name,
-                        "password": hash_password(password),
-                        "created_at": now,
-                        "last_modified": now,
-                        "metadata": unflatten_dict(metadata or {}),
-                    }
-                    result = self._queues.insert_one(queue, session=session)
-                    return str(result.inserted_id)
-                except DuplicateKeyError:
-                    raise HTTPException(
-                        status_code=HTTP_409_CONFLICT,
-                        detail=f"Queue '{queue_name}' already exists",
-                    )
+        if password_hash is None:
+            if password is None:
+                raise HTTPException(
+                    status_code=HTTP_400_BAD_REQUEST,
+                    detail="Queue password is required",
+                )
+            password_hash = hash_password(password)
+        # Single insert: the unique index on queue_name provides the conflict
+        # detection, no transaction needed.
+        try:
+            now = get_current_time()
+            queue = {
+                "_id": _new_id(),
+                "queue_name": queue_name,
+                "password": password_hash,
+                "created_at": now,
+                "last_modified": now,
+                "metadata": unflatten_dict(metadata or {}),
+            }
+            result = self._queues.insert_one(queue)
+            return str(result.inserted_id)
+        except DuplicateKeyError:
+            raise HTTPException(
+                status_code=HTTP_409_CONFLICT,
+                detail=f"Queue '{queue_name}' already exists",
+            )
+
+    def _build_task(
+        self,
+        queue_id: str,
+        now,
+        task_name: Optional[str] = None,
+        args: Optional[Dict[str, Any]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        cmd: Optional[Union[str, List[str]]] = None,
+        heartbeat_timeout: Optional[float] = None,
+        task_timeout: Optional[int] = None,
+        max_retries: int = 3,
+        priority: int = Priority.MEDIUM,
+    ) -> Tuple[Dict[str, Any], StateTransitionEventHandle]:
+        """Build a task document and its CREATED -> PENDING event handle."""
+        if not args and not cmd:
+            raise HTTPException(
+                status_code=HTTP_400_BAD_REQUEST,
+                detail="Either args or cmd must be provided",
+            )
+
+        task_id = _new_id()
+
+        fsm = TaskFSM(
+            queue_id=queue_id,
+            entity_id=task_id,
+            current_state=TaskState.CREATED,
+            retries=0,
+            max_retries=max_retries,
+            metadata=None,
+        )
+        event_handle = fsm.create()
+
+        task = {
+            **_TASK_TEMPLATE,
+            "_id": task_id,
+            "queue_id": queue_id,
+            "status": TaskState.PENDING.value,
+            "task_name": task_name,
+            "created_at": now,
+            "last_modified": now,
+            "heartbeat_timeout": heartbeat_timeout,
+            "task_timeout": task_timeout,
+            "max_retries": max_retries,
+            "priority": priority,
+            "metadata": unflatten_dict(metadata or {}),
+            "args": unflatten_dict(args or {}),
+            "cmd": cmd or "",
+            "summary": {},
+        }
+        return task, event_handle
 
     @retry_on_transient
     @validate_arg
@@ -241,53 +651,71 @@ class DBService:
         priority: int = Priority.MEDIUM,
     ) -> str:
         """Create a task related to a queue."""
-        if not args and not cmd:
-            raise HTTPException(
-                status_code=HTTP_400_BAD_REQUEST,
-                detail="Either args or cmd must be provided",
-            )
-        with self._client.start_session() as session:
-            with session.start_transaction():
-                now = get_current_time()
-
-                task_id = str(uuid4())
+        now = get_current_time()
 
-                fsm = TaskFSM(
-                    queue_id=queue_id,
-                    entity_id=task_id,
-                    current_state=TaskState.CREATED,
-                    retries=0,
-                    max_retries=max_retries,
-                    metadata=None,
-                )
-                event_handle = fsm.create()
-
-                task = {
-                    "_id": task_id,
-                    "queue_id": queue_id,
-                    "status": TaskState.PENDING,
-                    "task_name": task_name,
-                    "created_at": now,
-                    "start_time": None,
-                    "last_heartbeat": None,
-                    "last_modified": now,
-                    "heartbeat_timeout": heartbeat_timeout,
-                    "task_timeout": task_timeout,
-                    "max_retries": max_retries,
-                    "retries": 0,
-                    "priority": priority,
-                    "metadata": unflatten_dict(metadata or {}),
-                    "args": unflatten_dict(args or {}),
-                    "cmd": cmd or "",
-                    "summary": {},
-                    "worker_id": None,
-                }
-                result = self._tasks.insert_one(task, session=session)
+        task, event_handle = self._build_task(
+            queue_id=queue_id,
+            now=now,
+            task_name=task_name,
+            args=args,
+            metadata=metadata,
+            cmd=cmd,
+            heartbeat_timeout=heartbeat_timeout,
+            task_timeout=task_timeout,
+            max_retries=max_retries,
+            priority=priority,
+        )
+        # Single insert, inherently atomic: no transaction needed.
+        result = self._tasks.insert_one(task)
 
         event_handle.update_fsm_event(task, commit=True)
 
         return str(result.inserted_id)
 
+    @retry_on_transient
+    @validate_arg
+    def create_tasks(
+        self,
+        queue_id: str,
+        tasks: List[Dict[str, Any]],
+    ) -> List[str]:
+        """Create multiple tasks in a single insert_many round-trip.
+
+        Args:
+            queue_id (str): The id of the queue to create the tasks in.
+            tasks (list): Task settings, each a dict of create_task keyword
+                arguments (task_name, args, cmd, ...).
+
+        Return:
+            task_ids: ids of the created tasks, in input order.
+        """
+        if not tasks:
+            return []
+
+        now = get_current_time()
+
+        docs = []
+        event_handles = []
+        for task_setting in tasks:
+            try:
+                task, event_handle = self._build_task(
+                    queue_id=queue_id, now=now, **task_setting
+                )
+            except TypeError as e:
+                raise HTTPException(
+                    status_code=HTTP_400_BAD_REQUEST,
+                    detail=f"Invalid task setting. Detail: {str(e)}",
+                )
+            docs.append(task)
+            event_handles.append(event_handle)
+
+        result = self._tasks.insert_many(docs, ordered=False)
+
+        for task, event_handle in zip(docs, event_handles):
+            event_handle.update_fsm_event(task, commit=True)
+
+        return [str(inserted_id) for inserted_id in result.inserted_ids]
+
     @retry_on_transient
     @validate_arg
     def create_worker(
@@ -298,34 +726,33 @@ class DBService:
         max_retries: int = 3,
     ) -> str:
         """Create a worker."""
-        with self._client.start_session() as session:
-            with session.start_transaction():
-                now = get_current_time()
+        now = get_current_time()
 
-                worker_id = str(uuid4())
+        worker_id = _new_id()
 
-                fsm = WorkerFSM(
-                    queue_id=queue_id,
-                    entity_id=worker_id,
-                    current_state=WorkerState.CREATED,
-                    retries=0,
-                    max_retries=max_retries,
-                    metadata=None,
-                )
-                event_handle = fsm.create()
-
-                worker = {
-                    "_id": worker_id,
-                    "queue_id": queue_id,
-                    "status": WorkerState.ACTIVE,
-                    "worker_name": worker_name,
-                    "metadata": unflatten_dict(metadata or {}),
-                    "retries": 0,
-                    "max_retries": max_retries,
-                    "created_at": now,
-                    "last_modified": now,
-                }
-                result = self._workers.insert_one(worker, session=session)
+        fsm = WorkerFSM(
+            queue_id=queue_id,
+            entity_id=worker_id,
+            current_state=WorkerState.CREATED,
+            retries=0,
+            max_retries=max_retries,
+            metadata=None,
+        )
+        event_handle = fsm.create()
+
+        worker = {
+            **_WORKER_TEMPLATE,
+            "_id": worker_id,
+            "queue_id": queue_id,
+            "status": WorkerState.ACTIVE.value,
+            "worker_name": worker_name,
+            "metadata": unflatten_dict(metadata or {}),
+            "max_retries": max_retries,
+            "created_at": now,
+            "last_modified": now,
+        }
+        # Single insert, inherently atomic: no transaction needed.
+        result = self._workers.insert_one(worker)
 
         event_handle.update_fsm_event(worker, commit=True)
 
@@ -366,6 +793,7 @@ class DBService:
                         {"queue_id": queue_id}, session=session
                     ).deleted_count
 
+                self._queue_cache_invalidate(queue_id)
                 return deleted_count
 
     @retry_on_transient
@@ -376,12 +804,10 @@ class DBService:
         task_id: str,
     ) -> int:
         """Delete a task."""
-        with self._client.start_session() as session:
-            with session.start_transaction():
-                # Delete task
-                return self._tasks.delete_one(
-                    {"_id": task_id, "queue_id": queue_id}, session=session
-                ).deleted_count
+        # Single delete, inherently atomic: no transaction needed.
+        return self._tasks.delete_one(
+            {"_id": task_id, "queue_id": queue_id}
+        ).deleted_count
 
     @retry_on_transient
     @validate_arg
@@ -409,6 +835,7 @@ class DBService:
                 affected_count += self._workers.delete_one(
                     {"_id": worker_id, "queue_id": queue_id}, session=session
                 ).deleted_count
+                self._worker_status_cache_invalidate(worker_id)
 
                 now = get_current_time()
                 if cascade_update:
@@ -431,46 +858,98 @@ class DBService:
         metadata_update: Optional[Dict[str, Any]] = None,
     ) -> int:
         """Update queue settings. Returns modified_count"""
-        with self._client.start_session() as session:
-            with session.start_transaction():
-                # Make sure name does not already exist
-                if new_queue_name and self._get_queue_by_name(
-                    new_queue_name, session=session, raise_exception=False
-                ):
-                    raise HTTPException(
-                        status_code=HTTP_400_BAD_REQUEST,
-                        detail=f"Queue name '{new_queue_name}' already exists",
-                    )
+        now = get_current_time()
+        # The KDF is deliberately slow; hash before touching the database.
+        new_password_hash = hash_password(new_password) if new_password else None
 
-                update_dict = {}
+        update_dict = {}
 
-                if new_queue_name:
-                    update_dict["queue_name"] = new_queue_name
-                if new_password:
-                    update_dict["password"] = hash_password(new_password)
+        if new_queue_name:
+            update_dict["queue_name"] = new_queue_name
+        if new_password_hash:
+            update_dict["password"] = new_password_hash
 
-                if metadata_update is None:
-                    metadata_update = {}
-                elif metadata_update == {}:  # set the metadata root field to empty dict
-                    metadata_update = {"metadata": {}}
-                else:
-                    metadata_update = sanitize_dict(metadata_update)
-                    metadata_update = add_key_prefix(
-                        metadata_update, prefix="metadata."
-                    )
+        if metadata_update is None:
+            metadata_update = {}
+        elif metadata_update == {}:  # set the metadata root field to empty dict
+            metadata_update = {"metadata": {}}
+        else:
+            metadata_update = sanitize_dict(metadata_update)
+            metadata_update = add_key_prefix(metadata_update, prefix="metadata.")
 
-                # Update queue settings
-                update = {
-                    "$set": {
-                        **update_dict,
-                        **metadata_update,
-                        "last_modified": get_current_time(),
-                    }
-                }
-                result = self._queues.update_one(
-                    {"_id": queue_id}, update, session=session
+        # Update queue settings. Name collisions are left to the unique index
+        # on queue_name instead of a read-then-write pre-check, which both
+        # saves a query and closes the race where a conflicting queue is
+        # created between check and update.
+        update = {
+            "$set": {
+                **update_dict,
+                **metadata_update,
+                "last_modified": now,
+            }
+        }
+        try:
+            result = self._queues.update_one({"_id": queue_id}, update)
+        except DuplicateKeyError:
+            raise HTTPException(
+                status_code=HTTP_400_BAD_REQUEST,
+                detail=f"Queue name '{new_queue_name}' already exists",
+            )
+        self._queue_cache_invalidate(queue_id)
+        return result.modified_count
+
+    def _worker_status_cache_get(self, queue_id: str, worker_id: str) -> Optional[str]:
+        """Get a cached worker status, or None if absent/expired/other queue."""
+        with self._worker_status_cache_lock:
+            entry = self._worker_status_cache.get(worker_id)
+            if entry is None:
+                return None
+            cached_at, cached_queue_id, status = entry
+            if (
+                cached_queue_id != queue_id
+                or time.monotonic() - cached_at > _WORKER_STATUS_CACHE_TTL
+            ):
+                del self._worker_status_cache[worker_id]
+                return None
+            return status
+
+    def _worker_status_cache_put(
+        self, queue_id: str, worker_id: str, status: str
+    ) -> None:
+        with self._worker_status_cache_lock:
+            self._worker_status_cache[worker_id] = (time.monotonic(), queue_id, status)
+
+    def _worker_status_cache_invalidate(self, worker_id: Optional[str] = None) -> None:
+        """Drop a cached worker status (all entries if worker_id is None)."""
+        with self._worker_status_cache_lock:
+            if worker_id is None:
+                self._worker_status_cache.clear()
+            else:
+                self._worker_status_cache.pop(worker_id, None)
+
+    def _verify_worker_active(self, queue_id: str, worker_id: str, session=None):
+        """Raise unless the worker exists in the queue and is active."""
+        worker_status = self._worker_status_cache_get(queue_id, worker_id)
+        if worker_status is None:
+            # Only the status field is inspected here; skip the rest of the
+            # worker document (metadata can be arbitrarily large).
+            worker = self._workers.find_one(
+                {"_id": worker_id, "queue_id": queue_id},
+                {"status": 1},
+                session=session,
+            )
+            if not worker:
+                raise HTTPException(
+                    status_code=HTTP_404_NOT_FOUND,
+                    detail=f"Worker '{worker_id}' not found in queue '{queue_id}'",
                 )
-                return result.modified_count
+            worker_status = worker["status"]
+            self._worker_status_cache_put(queue_id, worker_id, worker_status)
+        if worker_status != WorkerState.ACTIVE:
+            raise HTTPException(
+                status_code=HTTP_403_FORBIDDEN,
+                detail=f"Worker '{worker_id}' is {worker_status} in queue '{queue_id}'",
+            )
 
     @retry_on_transient
     @validate_arg
@@ -515,83 +994,94 @@ class DBService:
                 detail="Eta max must be specified when start_heartbeat is False",
             )
 
-        fetched_task = None
-        with self._client.start_session() as session:
-            with session.start_transaction():
-                # Verify worker status if specified
-                if worker_id:
-                    worker = self._workers.find_one(
-                        {"_id": worker_id, "queue_id": queue_id}, session=session
-                    )
-                    if not worker:
-                        raise HTTPException(
-                            status_code=HTTP_404_NOT_FOUND,
-                            detail=f"Worker '{worker_id}' not found in queue '{queue_id}'",
-                        )
-                    worker_status = worker["status"]
-                    if worker_status != WorkerState.ACTIVE:
-                        raise HTTPException(
-                            status_code=HTTP_403_FORBIDDEN,
-                            detail=f"Worker '{worker_id}' is {worker_status} in queue '{queue_id}'",
-                        )
-
-                # Fetch task
-                now = get_current_time()
+        # "no less" of the "no more, no less" principle, user demanded fields must
+        # exist in task args
+        # even if allow_arbitrary_args==True, this principle should still be followed
+        # else it may lead to unexpected missing keys.
+        try:
+            query_dict = keys_to_query_dict(required_fields, mode="deepest")
+        except (TypeError, ValueError) as e:
+            raise HTTPException(
+                status_code=HTTP_400_BAD_REQUEST,
+                detail=f"Invalid required fields. Detail: {str(e)}",
+            )
+        required_fields_filter = query_dict_to_mongo_filter(
+            query_dict, parent_key="args"
+        )
 
-                # "no less" of the "no more, no less" principle, user demanded fields must
-                # exist in task args
-                # even if allow_arbitrary_args==True, this principle should still be followed
-                # else it may lead to unexpected missing keys.
-                try:
-                    query_dict = keys_to_query_dict(required_fields, mode="deepest")
-                except (TypeError, ValueError) as e:
-                    raise HTTPException(
-                        status_code=HTTP_400_BAD_REQUEST,
-                        detail=f"Invalid required fields. Detail: {str(e)}",
-                    )
-                required_fields_filter = query_dict_to_mongo_filter(
-                    query_dict, parent_key="args"
-                )
+        combined_filter = merge_filter(
+            required_fields_filter, extra_filter, logical_op="and"
+        )
 
-                combined_filter = merge_filter(
-                    required_fields_filter, extra_filter, logical_op="and"
-                )
+        sanitized_filter = sanitize_query(queue_id, combined_filter)
 
-                sanitized_filter = sanitize_query(queue_id, combined_filter)
+        # Construct the query
+        query = {
+            **sanitized_filter,
+            "queue_id": queue_id,
+            "status": TaskState.PENDING.value,
+        }
 
-                # Construct the query
-                query = {
-                    **sanitized_filter,
-                    "queue_id": queue_id,
-                    "status": TaskState.PENDING,
-                }
+        now = get_current_time()
 
-                update = {
-                    "$set": {
-                        "status": TaskState.RUNNING,
-                        "start_time": now,
-                        "last_heartbeat": now if start_heartbeat else None,
-                        "last_modified": now,
-                        "worker_id": worker_id,
-                    }
-                }
+        update = _claim_update(
+            now,
+            worker_id=worker_id,
+            start_heartbeat=start_heartbeat,
+            task_timeout=task_timeout,
+            heartbeat_timeout=heartbeat_timeout,
+        )
 
-                if task_timeout:
-                    update["$set"]["task_timeout"] = task_timeout
+        # Verify worker status if specified. Done before opening any
+        # transaction: it is a read-only precondition check, and failing early
+        # avoids starting (and aborting) a transaction for rejected workers.
+        if worker_id:
+            self._verify_worker_active(queue_id, worker_id)
+
+        # Fast path: without the Python-side "no more" args check there is no
+        # candidate filtering between read and claim, so fetching collapses
+        # into one atomic find_one_and_update. The status guard in the query
+        # makes concurrent claimers miss instead of double-dispatching, which
+        # is exactly what the multi-statement transaction provided.
+        if allow_arbitrary_args or not required_fields:
+            fetched_task = self._tasks.find_one_and_update(
+                query,
+                update,
+                sort=_FETCH_SORT,
+                return_document=ReturnDocument.AFTER,
+            )
+            if fetched_task is None:
+                return None
 
-                if heartbeat_timeout:
-                    update["$set"]["heartbeat_timeout"] = heartbeat_timeout
+            fsm = TaskFSM(
+                queue_id=queue_id,
+                entity_id=fetched_task["_id"],
+                current_state=TaskState.PENDING,  # claimed from PENDING by the query
+                retries=fetched_task["retries"],
+                max_retries=fetched_task["max_retries"],
+                metadata=None,
+            )
+            event_handle = fsm.fetch()
+            event_handle.update_fsm_event(fetched_task, commit=True)
+            return fetched_task
 
+        fetched_task = None
+        with self._client.start_session() as session:
+            with session.start_transaction():
+                # Project candidates down to what arg_match and the FSM need;
+                # the claiming find_one_and_update below returns the full doc.
                 tasks = list(
                     self._tasks.find(
                         query,
+                        {
+                            "args": 1,
+                            "status": 1,
+                            "retries": 1,
+                            "max_retries": 1,
+                            "queue_id": 1,
+                        },
                         session=session,
-                        # sort: highest priority, least recently modified, oldest created
-                        sort=[
-                            ("priority", -1),
-                            ("last_modified", 1),
-                            ("created_at", 1),
-                        ],
+                        sort=_FETCH_SORT,
                     )
                 )
 
@@ -626,6 +1116,162 @@ class DBService:
 
         return None  # Return None if no tasks matched
 
+    @retry_on_transient
+    @validate_arg
+    def fetch_tasks(
+        self,
+        queue_id: str,
+        worker_id: Optional[str] = None,
+        limit: int = 1,
+        eta_max: Optional[str] = None,
+        heartbeat_timeout: Optional[float] = None,
+        start_heartbeat: bool = True,
+        required_fields: Optional[List[str]] = None,
+        extra_filter: Optional[Dict[str, Any]] = None,
+    ) -> List[Mapping[str, Any]]:
+        """
+        Fetch up to `limit` available tasks from queue in one round.
+
+        Same semantics as fetch_task applied per task, but candidates are
+        claimed with a single bulk_write of per-task conditional updates
+        (guarded on status PENDING) instead of one claim round-trip per task.
+        Tasks a concurrent claimer wins in between are simply left out of the
+        result.
+
+        Args:
+            queue_id (str): The id of the queue to fetch tasks from.
+            worker_id (str, optional): The ID of the worker to assign the tasks to.
+            limit (int): Maximum number of tasks to claim.
+            eta_max (str, optional): The optional task execution timeout override.
+            heartbeat_timeout (float, optional): The optional heartbeat timeout interval in seconds.
+            start_heartbeat (bool): Whether to start heartbeat.
+            required_fields (list, optional): Which fields are required. If None, no constraint is put on which fields should exist in args dict.
+            extra_filter (Dict[str, Any], optional): Additional filter criteria for the tasks.
+
+        Returns:
+            The claimed task documents, in dispatch order.
+        """
+        task_timeout = parse_timeout(eta_max) if eta_max else None
+
+        required_fields = required_fields or []
+
+        allow_arbitrary_args = "*" in required_fields
+        if allow_arbitrary_args:  # prevent "*" messing with constructed mongodb query
+            required_fields.remove("*")
+
+        if limit <= 0:
+            raise HTTPException(
+                status_code=HTTP_400_BAD_REQUEST,
+                detail="limit must be a positive integer",
+            )
+
+        if not start_heartbeat and not task_timeout:
+            raise HTTPException(
+                status_code=HTTP_400_BAD_REQUEST,
+                detail="Eta max must be specified when start_heartbeat is False",
+            )
+
+        try:
+            query_dict = keys_to_query_dict(required_fields, mode="deepest")
+        except (TypeError, ValueError) as e:
+            raise HTTPException(
+                status_code=HTTP_400_BAD_REQUEST,
+                detail=f"Invalid required fields. Detail: {str(e)}",
+            )
+        required_fields_filter = query_dict_to_mongo_filter(
+            query_dict, parent_key="args"
+        )
+
+        combined_filter = merge_filter(
+            required_fields_filter, extra_filter, logical_op="and"
+        )
+
+        sanitized_filter = sanitize_query(queue_id, combined_filter)
+
+        query = {
+            **sanitized_filter,
+            "queue_id": queue_id,
+            "status": TaskState.PENDING.value,
+        }
+
+        now = get_current_time()
+
+        update = _claim_update(
+            now,
+            worker_id=worker_id,
+            start_heartbeat=start_heartbeat,
+            task_timeout=task_timeout,
+            heartbeat_timeout=heartbeat_timeout,
+        )
+
+        if worker_id:
+            self._verify_worker_active(queue_id, worker_id)
+
+        # Walk candidates lazily in dispatch order, applying the "no more"
+        # args check, until `limit` claimable tasks are collected.
+        required_fields_no_more = keys_to_query_dict(required_fields, mode="topmost")
+        candidate_ids = []
+        for task in self._tasks.find(
+            query,
+            sort=_FETCH_SORT,
+        ):
+            if (
+                not allow_arbitrary_args
+                and required_fields_no_more
+                and not arg_match(required_fields_no_more, task["args"])
+            ):
+                continue
+            candidate_ids.append(task["_id"])
+            if len(candidate_ids) >= limit:
+                break
+
+        if not candidate_ids:
+            return []
+
+        # Claim all candidates in one batch; the per-op status guard makes
+        # concurrently claimed tasks no-ops instead of double dispatches.
+        # Each claim is stamped with a token unique to this call: timestamps
+        # only have millisecond precision in BSON, so two concurrent calls
+        # landing in the same millisecond could not otherwise tell their
+        # claims apart in the re-fetch below.
+        claim_id = _new_id()
+        update[0]["$set"]["claim_id"] = claim_id
+        self._tasks.bulk_write(
+            [
+                UpdateOne({"_id": task_id, "status": TaskState.PENDING.value}, update)
+                for task_id in candidate_ids
+            ],
+            ordered=False,
+        )
+
+        # Re-fetch the documents this call actually claimed via its token.
+        claimed = {
+            task["_id"]: task
+            for task in self._tasks.find(
+                {
+                    "_id": {"$in": candidate_ids},
+                    "claim_id": claim_id,
+                }
+            )
+        }
+        fetched_tasks = [
+            claimed[task_id] for task_id in candidate_ids if task_id in claimed
+        ]
+
+        for task in fetched_tasks:
+            fsm = TaskFSM(
+                queue_id=queue_id,
+                entity_id=task["_id"],
+                current_state=TaskState.PENDING,  # claimed from PENDING by the guard
+                retries=task["retries"],
+                max_retries=task["max_retries"],
+                metadata=None,
+            )
+            event_handle = fsm.fetch()
+            event_handle.update_fsm_event(task, commit=True)
+
+        return fetched_tasks
+
     @retry_on_transient
     @validate_arg
     def refresh_task_heartbeat(
@@ -634,16 +1280,35 @@ class DBService:
         task_id: str,
     ) -> bool:
         """Update task heartbeat timestamp."""
-        with self._client.start_session() as session:
-            with session.start_transaction():
-                return (
-                    self._tasks.update_one(
-                        {"_id": task_id, "queue_id": queue_id},
-                        {"$set": {"last_heartbeat": get_current_time()}},
-                        session=session,
-                    ).modified_count
-                    > 0
-                )
+        # Single update, inherently atomic: no transaction needed.
+        return (
+            self._tasks.update_one(
+                {"_id": task_id, "queue_id": queue_id},
+                _heartbeat_update(get_current_time()),
+            ).modified_count
+            > 0
+        )
+
+    @retry_on_transient
+    @validate_arg
+    def refresh_task_heartbeats(
+        self,
+        queue_id: str,
+        task_ids: List[str],
+    ) -> int:
+        """Update heartbeat timestamps for a batch of tasks in one round-trip.
+
+        Callers that track several running tasks (e.g. a worker loop holding a
+        batch from fetch_tasks) can coalesce their per-interval heartbeats into
+        a single update_many instead of one update_one per task. Returns the
+        number of tasks whose heartbeat was refreshed.
+        """
+        if not task_ids:
+            return 0
+        return self._tasks.update_many(
+            {"_id": {"$in": task_ids}, "queue_id": queue_id},
+            _heartbeat_update(get_current_time()),
+        ).modified_count
 
     @retry_on_transient
     @validate_arg
@@ -672,6 +1337,7 @@ class DBService:
         Returns:
 
         """
+        now = get_current_time()
         with self._client.start_session() as session:
             with session.start_transaction():
                 task = self._tasks.find_one(
@@ -697,6 +1363,7 @@ class DBService:
                     report_status=report_status,
                     summary_update=summary_update,
                     session=session,
+                    now=now,
                 )
 
         for event_handle in event_handles:
@@ -714,6 +1381,7 @@ class DBService:
         summary_update: Optional[Dict[str, Any]] = None,
     ) -> bool:
         """Update task status. Used for reporting task execution results."""
+        now = get_current_time()
         with self._client.start_session() as session:
             with session.start_transaction():
                 task = self._tasks.find_one(
@@ -730,6 +1398,7 @@ class DBService:
                     report_status=report_status,
                     summary_update=summary_update,
                     session=session,
+                    now=now,
                 )
 
         for event_handle in event_handles:
@@ -737,8 +1406,12 @@ class DBService:
         return True
 
     def _report_task_status(
-        self, queue_id, task, report_status, summary_update, session
+        self, queue_id, task, report_status, summary_update, session, now=None
     ) -> List[StateTransitionEventHandle]:
+        # `now` is threaded from the caller so one request shares a single
+        # timestamp across the task and worker updates it triggers.
+        if now is None:
+            now = get_current_time()
         event_handles = []
         task_id = task["_id"]
         try:
@@ -769,6 +1442,7 @@ class DBService:
                 worker_id=task["worker_id"],
                 report_status="failed",
                 session=session,
+                now=now,
             )
             event_handles.append(worker_event_handle)
 
@@ -783,22 +1457,30 @@ class DBService:
         update = {
             "$set": {
                 **summary_update,
-                "status": fsm.state,
+                "status": fsm.state.value,
                 "retries": fsm.retries,
-                "last_modified": get_current_time(),
+                "last_modified": now,
                 "worker_id": None,
             }
         }
 
+        # Guard on the status the FSM transition was computed from, so the
+        # read-validate-write sequence stays atomic: a concurrent transition
+        # makes the filter miss instead of silently overwriting it.
         updated_task = self._tasks.find_one_and_update(
-            {"_id": task_id},
+            {"_id": task_id, "status": task["status"]},
             update,
             session=session,
             return_document=ReturnDocument.AFTER,
         )
+        if updated_task is None:
+            raise HTTPException(
+                status_code=HTTP_409_CONFLICT,
+                detail=f"Task {task_id} was modified concurrently. Please retry.",
+            )
 
         # Update the event with entity data and publish
-        event_handle.update_fsm_event(updated_task)  # type: ignore
+        event_handle.update_fsm_event(updated_task)
         event_handles.append(event_handle)
 
         return event_handles
@@ -827,8 +1509,12 @@ class DBService:
         """
         with self._client.start_session() as session:
             with session.start_transaction():
+                # The pre-update read only feeds the FSM; the updated document
+                # is re-fetched in full below.
                 task = self._tasks.find_one(
-                    {"_id": task_id, "queue_id": queue_id}, session=session
+                    {"_id": task_id, "queue_id": queue_id},
+                    {"status": 1, "retries": 1, "max_retries": 1, "queue_id": 1},
+                    session=session,
                 )
                 if not task:
                     return False
@@ -857,7 +1543,7 @@ class DBService:
 
                 if reset_pending:
                     event_handle = fsm.reset()
-                    task_setting_update["status"] = fsm.state  # PENDING
+                    task_setting_update["status"] = fsm.state.value  # PENDING
                     task_setting_update["retries"] = fsm.retries  # 0
                 else:
                     event_handle = None
@@ -889,10 +1575,16 @@ class DBService:
         return self._tasks.find_one({"_id": task_id, "queue_id": queue_id})
 
     def _report_worker_status(
-        self, queue_id: str, worker_id: str, report_status: str, session=None
+        self, queue_id: str, worker_id: str, report_status: str, session=None, now=None
     ) -> StateTransitionEventHandle:
+        if now is None:
+            now = get_current_time()
+        # The pre-update read only feeds the FSM; the updated document is
+        # re-fetched in full below for the event payload.
         worker = self._workers.find_one(
-            {"_id": worker_id, "queue_id": queue_id}, session=session
+            {"_id": worker_id, "queue_id": queue_id},
+            {"status": 1, "retries": 1, "max_retries": 1, "queue_id": 1},
+            session=session,
         )
         if not worker:
             raise HTTPException(
@@ -922,9 +1614,9 @@ class DBService:
 
         update = {
             "$set": {
-                "status": fsm.state,
+                "status": fsm.state.value,
                 "retries": fsm.retries,
-                "last_modified": get_current_time(),
+                "last_modified": now,
             }
         }
 
@@ -934,6 +1626,7 @@ class DBService:
             session=session,
             return_document=ReturnDocument.AFTER,
         )
+        self._worker_status_cache_invalidate(worker_id)
 
         # Update the event with entity data and publish
         event_handle.update_fsm_event(updated_worker)
@@ -964,15 +1657,11 @@ class DBService:
         """Retrieve a worker by ID."""
         return self._workers.find_one({"_id": worker_id, "queue_id": queue_id})
 
-    def _get_queue_by_name(
-        self, queue_name: str, session=None, raise_exception=True
-    ) -> Optional[Mapping[str, Any]]:
-        """Get queue by name with error handling.
+    def _get_queue_by_name(self, queue_name: str) -> Mapping[str, Any]:
+        """Get queue by name, via the shared queue cache.
 
         Args:
             queue_name: Name of queue to find
-            session: Optional MongoDB session for transactions
-            raise_exception: if not found, raise HTTPException
 
         Returns:
             Queue document
@@ -980,14 +1669,16 @@ class DBService:
         Raises:
             HTTPException: If queue not found
         """
-        queue = self._queues.find_one({"queue_name": queue_name}, session=session)
+        queue = self._queue_cache_get(("name", queue_name))
+        if queue is None:
+            queue = self._queues.find_one({"queue_name": queue_name})
+            if queue is not None:
+                self._queue_cache_put(queue)
         if not queue:
-            if raise_exception:
-                raise HTTPException(
-                    status_code=HTTP_404_NOT_FOUND,
-                    detail=f"Queue '{queue_name}' not found",
-                )
-            return None
+            raise HTTPException(
+                status_code=HTTP_404_NOT_FOUND,
+                detail=f"Queue '{queue_name}' not found",
+            )
         return queue
 
     @retry_on_transient
@@ -998,124 +1689,228 @@ class DBService:
         queue_name: Optional[str] = None,
     ) -> Optional[Mapping[str, Any]]:
         """Get queue by id or name. Name and id must match."""
-        with self._client.start_session() as session:
-            with session.start_transaction():
-                if queue_id:
-                    queue = self._queues.find_one({"_id": queue_id}, session=session)
-                else:
-                    queue = self._get_queue_by_name(queue_name, session=session)  # type: ignore
-
-                if not queue:
-                    return None
+        if not queue_id:
+            return self._get_queue_by_name(queue_name)  # type: ignore
+
+        # Serve id lookups from the shared queue cache when the cached entry
+        # is consistent with the requested name; a mismatch falls through to
+        # the database rather than trusting a possibly stale entry.
+        cached = self._queue_cache_get(("id", queue_id))
+        if cached is not None and (
+            not queue_name or cached["queue_name"] == queue_name
+        ):
+            return cached
+
+        # Both identifiers go into one filter, so the common case is a single
+        # read with no transaction. A miss is classified afterwards: if the
+        # id exists under a different name the caller mixed up identifiers
+        # (400); otherwise the queue simply does not exist (None).
+        filter: Dict[str, Any] = {"_id": queue_id}
+        if queue_name:
+            filter["queue_name"] = queue_name
+
+        queue = self._queues.find_one(filter)
+        if queue is not None:
+            self._queue_cache_put(queue)
+            return queue
+
+        if queue_name and self._queues.find_one({"_id": queue_id}) is not None:
+            raise HTTPException(
+                status_code=HTTP_400_BAD_REQUEST,
+                detail=f"Queue '{queue_name}' does not match queue_id '{queue_id}'",
+            )
 
-                # Make sure the provided queue_name and queue_id match
-                if queue_id and queue["_id"] != queue_id:
-                    raise HTTPException(
-                        status_code=HTTP_400_BAD_REQUEST,
-                        detail=f"Queue '{queue_name}' does not match queue_id '{queue_id}'",
-                    )
+        return None
 
-                if queue_name and queue["queue_name"] != queue_name:
-                    raise HTTPException(
-                        status_code=HTTP_400_BAD_REQUEST,
-                        detail=f"Queue '{queue_name}' does not match queue_id '{queue_id}'",
-                    )
+    @retry_on_transient
+    def next_timeout_eta(self) -> Optional[float]:
+        """Earliest deadline (epoch seconds) among running tasks, or None.
 
-                return queue
+        Lets the timeout poller sleep until something can actually expire
+        instead of ticking blindly at a fixed cadence. Each lookup is a
+        one-document walk of the corresponding partial deadline index.
+        """
+        candidates = []
+        for field in ("heartbeat_deadline", "task_deadline"):
+            doc = self._tasks.find_one(
+                {"status": TaskState.RUNNING.value, field: {"$ne": None}},
+                {field: 1},
+                sort=[(field, ASCENDING)],
+            )
+            if doc is not None:
+                candidates.append(doc[field])
+        return min(candidates) if candidates else None
 
     @retry_on_transient
     def handle_timeouts(self) -> List[str]:
-        """Check and handle task timeouts."""
+        """Check and handle task timeouts.
+
+        Single-flight: concurrent invocations (overlapping poller ticks, or
+        several request threads) would each run the same scan only for the
+        status-guarded claims to no-op against each other. A non-blocking
+        lock lets one sweep run at a time; late callers return immediately
+        with no transitions and leave anything remaining to the next tick.
+        """
+        if not self._timeout_sweep_lock.acquire(blocking=False):
+            return []
+        try:
+            return self._handle_timeouts()
+        finally:
+            self._timeout_sweep_lock.release()
+
+    def _handle_timeouts(self) -> List[str]:
         now = get_current_time()
+        now_ts = now.timestamp()
         transitioned_tasks = []
 
-        # Build query
+        # Idle fast path: most sweeps have nothing to do. A single indexed
+        # existence probe is cheaper than setting up the $or range scan, and
+        # a task that starts running between this probe and the scan cannot
+        # have timed out yet anyway.
+        if (
+            self._tasks.find_one({"status": TaskState.RUNNING.value}, {"_id": 1})
+            is None
+        ):
+            return transitioned_tasks
+
+        # Deadlines are precomputed at claim/heartbeat time, so the sweep is
+        # a plain (indexable) range query instead of per-document $expr
+        # arithmetic evaluated over the whole collection.
         query = {
-            "status": TaskState.RUNNING,
+            "status": TaskState.RUNNING.value,
             "$or": [
-                # Heartbeat timeout
-                {
-                    "last_heartbeat": {"$ne": None},
-                    "heartbeat_timeout": {"$ne": None},
-                    "$expr": {
-                        "$gt": [
-                            {
-                                "$divide": [
-                                    {"$subtract": [now, "$last_heartbeat"]},
-                                    1000,
-                                ]
-                            },
-                            "$heartbeat_timeout",
-                        ]
-                    },
-                },
-                # Task execution timeout
-                {
-                    "task_timeout": {"$ne": None},
-                    "start_time": {"$ne": None},
-                    "$expr": {
-                        "$gt": [
-                            {"$divide": [{"$subtract": [now, "$start_time"]}, 1000]},
-                            "$task_timeout",
-                        ]
-                    },
-                },
+                {"heartbeat_deadline": {"$ne": None, "$lt": now_ts}},
+                {"task_deadline": {"$ne": None, "$lt": now_ts}},
             ],
         }
 
         fsm_event_handles = []
-        with self._client.start_session() as session:
-            with session.start_transaction():
-                # Find tasks that might have timed out
-                tasks = self._tasks.find(query, session=session)
-
-                tasks = list(tasks)  # type: ignore
 
-                for task in tasks:
-                    try:
-                        # Create FSM with current state
-                        fsm = TaskFSM.from_db_entry(task)
+        # No transaction: each group claim is an atomic update_many guarded on
+        # status RUNNING, so a task either transitions here or was already
+        # moved out of RUNNING by a concurrent reporter — the same guarantee
+        # the transaction provided, without holding a snapshot for the whole
+        # sweep. Worker reports below are per-worker single updates.
+        # Run the FSM transitions in Python first and group tasks with an
+        # identical resulting (status, retries), so K timed-out tasks cost
+        # one update_many per distinct outcome (usually one or two) instead
+        # of one round-trip each. The cursor is walked lazily and projected
+        # to the fields the transition and worker report need; the
+        # post-claim re-fetch returns full documents for the events.
+        event_handles: Dict[str, StateTransitionEventHandle] = {}
+        groups: Dict[Tuple[str, int], List[Mapping[str, Any]]] = {}
+        for task in self._tasks.find(
+            query,
+            {
+                "status": 1,
+                "retries": 1,
+                "max_retries": 1,
+                "worker_id": 1,
+                "queue_id": 1,
+            },
+        ):
+            try:
+                fsm = TaskFSM.from_db_entry(task)
+                event_handles[task["_id"]] = fsm.fail()
+                groups.setdefault((fsm.state.value, fsm.retries), []).append(task)
+            except Exception as e:
+                # Log error but continue processing other tasks
+                logger.exception(f"Error handling timeout for task {task['_id']}: {e}")
+
+        claimed_tasks: List[Tuple[Mapping[str, Any], Mapping[str, Any]]] = []
+        for (new_status, new_retries), group in groups.items():
+            group_ids = [task["_id"] for task in group]
+            # The status guard makes the claim atomic: tasks a concurrent
+            # reporter moved out of RUNNING are skipped.
+            self._tasks.update_many(
+                {
+                    "_id": {"$in": group_ids},
+                    "status": TaskState.RUNNING.value,
+                },
+                {
+                    "$set": {
+                        "status": new_status,
+                        "retries": new_retries,
+                        "last_modified": now,
+                        "worker_id": None,
+                        "summary.labtasker_error": "Either heartbeat or task execution timed out",
+                    }
+                },
+            )
+            claimed = {
+                doc["_id"]: doc
+                for doc in self._tasks.find(
+                    {
+                        "_id": {"$in": group_ids},
+                        "status": new_status,
+                        "last_modified": now,
+                    }
+                )
+            }
+            # Tasks missing from `claimed` were lost to a concurrent status
+            # change between the scan and the guarded claim.
+            claimed_tasks.extend(
+                (task, claimed[task["_id"]]) for task in group if task["_id"] in claimed
+            )
 
-                        # Transition to FAILED state through FSM
-                        event_handle = fsm.fail()
-
-                        # Update worker status if worker is specified
-                        if task["worker_id"]:
-                            worker_event_handle = self._report_worker_status(
-                                queue_id=task["queue_id"],
-                                worker_id=task["worker_id"],
-                                report_status="failed",
-                                session=session,
-                            )
-                            fsm_event_handles.append(worker_event_handle)
-
-                        # Update task in database
-                        updated_task = self._tasks.find_one_and_update(
-                            {"_id": task["_id"]},
-                            {
-                                "$set": {
-                                    "status": fsm.state,
-                                    "retries": fsm.retries,
-                                    "last_modified": now,
-                                    "worker_id": None,
-                                    "summary.labtasker_error": "Either heartbeat or task execution timed out",
-                                }
-                            },
-                            return_document=ReturnDocument.AFTER,
-                            session=session,
-                        )
+        # One failure report per distinct worker: a dead worker that held
+        # many tasks failed once, not once per task, so deduplicating both
+        # matches the retry semantics and drops the per-task report fan-out.
+        # The independent reports are overlapped with a bounded thread pool;
+        # results land in a dict keyed by worker id (atomic under the GIL),
+        # with exceptions stored for per-task handling below.
+        worker_tasks: Dict[str, List[Mapping[str, Any]]] = {}
+        for task, _ in claimed_tasks:
+            if task["worker_id"]:
+                worker_tasks.setdefault(task["worker_id"], []).append(task)
+
+        worker_report_results: Dict[str, Any] = {}
+
+        def _report_worker_failure(item: Tuple[str, List[Mapping[str, Any]]]) -> None:
+            worker_id, tasks_of_worker = item
+            try:
+                worker_report_results[worker_id] = self._report_worker_status(
+                    queue_id=tasks_of_worker[0]["queue_id"],
+                    worker_id=worker_id,
+                    report_status="failed",
+                    now=now,
+                )
+            except Exception as e:
+                worker_report_results[worker_id] = e
+
+        if worker_tasks:
+            with ThreadPoolExecutor(
+                max_workers=min(_TIMEOUT_REPORT_CONCURRENCY, len(worker_tasks))
+            ) as executor:
+                list(executor.map(_report_worker_failure, worker_tasks.items()))
+
+        emitted_worker_events: Set[str] = set()
+        for task, updated_task in claimed_tasks:
+            worker_id = task["worker_id"]
+            report_result = worker_report_results.get(worker_id) if worker_id else None
+            if isinstance(report_result, Exception):
+                # The task itself already transitioned in the database via
+                # the group claim above; only the worker report failed (e.g.
+                # the worker is no longer ACTIVE). Log it and skip just the
+                # worker event — the task's own transition event must still
+                # be emitted, or the event stream would desynchronize from
+                # the database state.
+                logger.error(
+                    f"Error reporting worker failure for task {task['_id']}: "
+                    f"{report_result}",
+                    exc_info=report_result,
+                )
+            elif report_result is not None and worker_id not in emitted_worker_events:
+                emitted_worker_events.add(worker_id)
+                fsm_event_handles.append(report_result)
 
-                        event_handle.update_fsm_event(updated_task)
-                        fsm_event_handles.append(event_handle)
+            event_handle = event_handles[task["_id"]]
+            event_handle.update_fsm_event(updated_task)
+            fsm_event_handles.append(event_handle)
 
-                        transitioned_tasks.append(task["_id"])
-                    except Exception as e:
-                        # Log error but continue processing other tasks
-                        logger.info(
-                            f"Error handling timeout for task {task['_id']}: {e}"
-                        )
+            transitioned_tasks.append(task["_id"])
 
-        # commit the event after the transaction is completed
+        # commit the events once all database writes have landed
         for event_handle in fsm_event_handles:
             event_handle.commit()
 
@@ -1123,12 +1918,18 @@ class DBService:
 
 
 _db_service = None
+_db_service_lock = threading.Lock()
 
 
 def get_db() -> DBService:
     """Get database service instance."""
     global _db_service
-    config = get_server_config()
-    if not _db_service:
-        _db_service = DBService(db_name=config.db_name, uri=config.mongodb_uri)
+    # Double-checked: the hot path is a plain read with no lock or config
+    # lookup; the lock only serializes the first construction so concurrent
+    # requests cannot race to build two services.
+    if _db_service is None:
+        with _db_service_lock:
+            if _db_service is None:
+                config = get_server_config()
+                _db_service = DBService(db_name=config.db_name, uri=config.mongodb_uri)
     return _db_service
@@ -19,6 +19,8 @@ from labtasker.api_models import (
     QueueGetResponse,
     QueueUpdateRequest,
     Task,
+    TaskBatchSubmitRequest,
+    TaskBatchSubmitResponse,
     TaskFetchRequest,
     TaskFetchResponse,
     TaskLsRequest,
@@ -34,6 +36,7 @@ from labtasker.api_models import (
     WorkerLsResponse,
     WorkerStatusUpdateRequest,
 )
+from labtasker.security import hash_password
 from labtasker.server.config import get_server_config
 from labtasker.server.database import DBService
 from labtasker.server.dependencies import get_db, get_verified_queue_dependency
@@ -42,9 +45,15 @@ from labtasker.server.logging import logger
 from labtasker.utils import get_current_time, parse_obj_as, unflatten_dict
 
 
+# Floor for the adaptive timeout poll so a burst of near deadlines cannot
+# degenerate into busy-waiting on the database.
+MIN_POLL_INTERVAL = 0.5  # seconds
+
+
 async def periodic_task(app: FastAPI, interval_seconds: float):
     """Run a periodic task at specified intervals."""
     while True:
+        sleep_seconds = interval_seconds
         try:
             # logger.info(
             #     f"now: {get_current_time()}, current_event_loop: {asyncio.get_running_loop().__hash__()}"
@@ -54,9 +63,22 @@ async def periodic_task(app: FastAPI, interval_seconds: float):
             app.state.prev_polling = get_current_time().timestamp()
             if transitioned_tasks:
                 logger.info(f"Transitioned {len(transitioned_tasks)} timed out tasks")
+
+            # Adaptive cadence: wake when the earliest running-task deadline
+            # can actually expire. The configured interval stays the upper
+            # bound so deadlines pushed out by heartbeats are re-checked.
+            next_eta = db.next_timeout_eta()
+            if next_eta is not None:
+                sleep_seconds = min(
+                    interval_seconds,
+                    max(
+                        MIN_POLL_INTERVAL,
+                        next_eta - get_current_time().timestamp(),
+                    ),
+                )
         except Exception as e:
-            logger.info(f"Error checking timeouts: {e}")
-        await asyncio.sleep(interval_seconds)
+            logger.exception(f"Error checking timeouts: {e}")
+        await asyncio.sleep(sleep_seconds)
 
 
 @asynccontextmanager
@@ -124,12 +146,17 @@ def get_polling():
 
 
 @app.post("/api/v1/queues", status_code=HTTP_201_CREATED)
-def create_queue(queue: QueueCreateRequest, db: DBService = Depends(get_db)):
+async def create_queue(queue: QueueCreateRequest, db: DBService = Depends(get_db)):
     """Create a new queue"""
+    # Password hashing is deliberately CPU-heavy; run it in the default
+    # executor so the event loop keeps serving other requests meanwhile.
+    password_hash = await asyncio.get_running_loop().run_in_executor(
+        None, hash_password, queue.password.get_secret_value()
+    )
     queue_id = db.create_queue(
         queue_name=queue.queue_name,
-        password=queue.password.get_secret_value(),
         metadata=queue.metadata,
+        password_hash=password_hash,
     )
     return QueueCreateResponse(queue_id=queue_id)
 
@@ -200,6 +227,22 @@ def submit_task(
     return TaskSubmitResponse(task_id=task_id)
 
 
+@app.post("/api/v1/queues/me/tasks/batch", status_code=HTTP_201_CREATED)
+def submit_tasks(
+    batch: TaskBatchSubmitRequest,
+    queue: Dict[str, Any] = Depends(get_verified_queue_dependency),
+    db: DBService = Depends(get_db),
+):
+    """Submit multiple tasks to the queue in a single request."""
+    task_ids = db.create_tasks(
+        queue_id=queue["_id"],
+        # client_version is request plumbing from BaseRequestModel, not a
+        # task setting
+        tasks=[task.model_dump(exclude={"client_version"}) for task in batch.tasks],
+    )
+    return TaskBatchSubmitResponse(task_ids=task_ids)
+
+
 @app.post(
     "/api/v1/queues/me/tasks/search",
     response_model=TaskLsResponse,
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Mapping, Optional, Set
+from typing import Any, Dict, FrozenSet, Mapping, Optional
 
 from fastapi import HTTPException
 from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR
@@ -112,10 +112,22 @@ class WorkerState(State):
     CRASHED = "crashed"
 
 
+def _transition_bitmasks(
+    valid_transitions: Dict[Enum, FrozenSet[Enum]], state_bits: Dict[Enum, int]
+) -> Dict[Enum, int]:
+    """Collapse each state's allowed targets into a single int bitmask."""
+    return {
+        state: sum(state_bits[target] for target in targets)
+        for state, targets in valid_transitions.items()
+    }
+
+
 class BaseFSM:
     """Base class for state machine."""
 
-    VALID_TRANSITIONS: Dict[Enum, Set[Enum]] = {}
+    # Immutable class-level tables: an FSM instance is built per request, so
+    # these must never be mutated through an instance by accident.
+    VALID_TRANSITIONS: Dict[Enum, FrozenSet[Enum]] = {}
     ENTITY_TYPE: EntityType  # To be set by subclasses
 
     def __init__(
@@ -175,26 +187,27 @@ class TaskFSM(BaseFSM):
     ENTITY_TYPE = EntityType.TASK
     # Define valid state transitions
     VALID_TRANSITIONS = {
-        TaskState.CREATED: {TaskState.PENDING},
-        TaskState.PENDING: {TaskState.RUNNING, TaskState.PENDING, TaskState.CANCELLED},
-        TaskState.RUNNING: {
-            TaskState.SUCCESS,
-            TaskState.FAILED,
-            TaskState.PENDING,
-            TaskState.CANCELLED,
-        },
-        TaskState.SUCCESS: {
-            TaskState.PENDING,
-            TaskState.CANCELLED,
-        },  # Can be reset and requeued
-        TaskState.FAILED: {
-            TaskState.PENDING,
-            TaskState.CANCELLED,
-        },  # Can be reset and requeued
-        TaskState.CANCELLED: {
-            TaskState.PENDING,
-            TaskState.CANCELLED,
-        },  # Can be reset and requeued
+        TaskState.CREATED: frozenset({TaskState.PENDING}),
+        TaskState.PENDING: frozenset(
+            {TaskState.RUNNING, TaskState.PENDING, TaskState.CANCELLED}
+        ),
+        TaskState.RUNNING: frozenset(
+            {
+                TaskState.SUCCESS,
+                TaskState.FAILED,
+                TaskState.PENDING,
+                TaskState.CANCELLED,
+            }
+        ),
+        TaskState.SUCCESS: frozenset(
+            {TaskState.PENDING, TaskState.CANCELLED}
+        ),  # Can be reset and requeued
+        TaskState.FAILED: frozenset(
+            {TaskState.PENDING, TaskState.CANCELLED}
+        ),  # Can be reset and requeued
+        TaskState.CANCELLED: frozenset(
+            {TaskState.PENDING, TaskState.CANCELLED}
+        ),  # Can be reset and requeued
     }
 
     def __init__(
@@ -298,16 +311,32 @@ class TaskFSM(BaseFSM):
 class WorkerFSM(BaseFSM):
     ENTITY_TYPE = EntityType.WORKER
     VALID_TRANSITIONS = {
-        WorkerState.CREATED: {WorkerState.ACTIVE},
-        WorkerState.ACTIVE: {
-            WorkerState.ACTIVE,
-            WorkerState.SUSPENDED,
-            WorkerState.CRASHED,
-        },
-        WorkerState.SUSPENDED: {WorkerState.ACTIVE},  # Manual transition
-        WorkerState.CRASHED: {WorkerState.ACTIVE},  # Manual transition
+        WorkerState.CREATED: frozenset({WorkerState.ACTIVE}),
+        WorkerState.ACTIVE: frozenset(
+            {WorkerState.ACTIVE, WorkerState.SUSPENDED, WorkerState.CRASHED}
+        ),
+        WorkerState.SUSPENDED: frozenset({WorkerState.ACTIVE}),  # Manual transition
+        WorkerState.CRASHED: frozenset({WorkerState.ACTIVE}),  # Manual transition
     }
 
+    # Bitmask form of VALID_TRANSITIONS: worker transitions are validated on
+    # every status report and timeout sweep, and a mask test replaces the
+    # dict-of-set lookup with one and-operation.
+    _STATE_BITS = {state: 1 << index for index, state in enumerate(WorkerState)}
+    _TRANSITION_MASKS = _transition_bitmasks(VALID_TRANSITIONS, _STATE_BITS)
+
+    def validate_transition(self, new_state) -> bool:
+        """Validate if a state transition is allowed (bitmask fast path)."""
+        mask = self._TRANSITION_MASKS.get(self.state)
+        bit = self._STATE_BITS.get(new_state)
+        if mask is None or bit is None or not mask & bit:
+            raise InvalidStateTransition(
+                f"Cannot transition from {self.state} to {new_state}",
+                old_state=self.state,
+                new_state=new_state,
+            )
+        return True
+
     def __init__(
         self,
         queue_id: str,
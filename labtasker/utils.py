@@ -1,14 +1,33 @@
 import os
 import re
 from datetime import datetime, timedelta
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, Dict, Type, Union
 
 from pydantic import TypeAdapter
 
 from labtasker.constants import DOT_SEPARATED_KEY_PATTERN
 
-
+# Unit mappings
+_TIMEOUT_UNIT_SECONDS = {
+    "h": 3600,
+    "hour": 3600,
+    "hours": 3600,
+    "m": 60,
+    "min": 60,
+    "minute": 60,
+    "minutes": 60,
+    "s": 1,
+    "sec": 1,
+    "second": 1,
+    "seconds": 1,
+}
+
+_TIMEOUT_SEP_RE = re.compile(r"[:,\s]+")
+_TIMEOUT_PAIR_RE = re.compile(r"(\d+\.?\d*)([a-z]+)")  # number-unit pairs
+
+
+@lru_cache(maxsize=256)
 def parse_timeout(timeout_str: str) -> float:
     """Convert timeout string to seconds.
 
@@ -18,6 +37,9 @@ def parse_timeout(timeout_str: str) -> float:
     - Multiple units: "1h30m", "5m30s", "1h30m15s"
     - Full words: "1 hour", "30 minutes", "1 hour, 30 minutes"
 
+    Results are memoized: callers (e.g. worker poll loops) tend to pass the
+    same handful of timeout strings over and over.
+
     Args:
         timeout_str: Timeout string to parse
 
@@ -38,33 +60,18 @@ def parse_timeout(timeout_str: str) -> float:
 
     # Clean up input
     timeout_str = timeout_str.lower().strip()
-    timeout_str = re.sub(
-        r"[:,\s]+", "", timeout_str
+    timeout_str = _TIMEOUT_SEP_RE.sub(
+        "", timeout_str
     )  # Remove all spaces, commas, and colons
 
     # Handle pure numbers (assume seconds)
     if timeout_str.isdigit():
         return int(timeout_str)
 
-    # Unit mappings
-    unit_map = {
-        "h": 3600,
-        "hour": 3600,
-        "hours": 3600,
-        "m": 60,
-        "min": 60,
-        "minute": 60,
-        "minutes": 60,
-        "s": 1,
-        "sec": 1,
-        "second": 1,
-        "seconds": 1,
-    }
-
     total_seconds = 0.0
 
     # Match alternating number-unit pairs
-    matches = re.findall(r"(\d+\.?\d*)([a-z]+)", timeout_str)
+    matches = _TIMEOUT_PAIR_RE.findall(timeout_str)
     if not matches or "".join(num + unit for num, unit in matches) != timeout_str:
         raise ValueError(f"Invalid timeout format: {timeout_str}")
 
@@ -74,10 +81,10 @@ def parse_timeout(timeout_str: str) -> float:
         except ValueError:
             raise ValueError(f"Invalid number: {value_str}")
 
-        if unit not in unit_map:
+        if unit not in _TIMEOUT_UNIT_SECONDS:
             raise ValueError(f"Invalid unit: {unit}")
 
-        total_seconds += value * unit_map[unit]
+        total_seconds += value * _TIMEOUT_UNIT_SECONDS[unit]
 
     return total_seconds
 
@@ -93,9 +93,9 @@ def cli_create_worker_by_default() -> str:
         ],
     )
     assert result.exit_code == 0, result.output
-    # uuid4 pattern
+    # uuid4 hex pattern
     worker_id = re.search(
-        r"[a-f0-9]{8}-[a-f0-9]{4}-4[a-f0-9]{3}-[89ab][a-f0-9]{3}-[a-f0-9]{12}",
+        r"[a-f0-9]{12}4[a-f0-9]{3}[89ab][a-f0-9]{15}",
         result.output,
     ).group(0)
     return worker_id
@@ -97,6 +97,36 @@ def test_create_task(db_fixture, queue_args, get_task_args, get_full_task_args):
     # TODO: test setting heartbeat_timeout, task_timeout, max_retries, priority
 
 
+@pytest.mark.integration
+@pytest.mark.unit
+def test_create_tasks(db_fixture, queue_args, get_task_args):
+    # Create queue first
+    queue_id = db_fixture.create_queue(**queue_args)
+
+    # Test 1. Bulk create several tasks at once
+    task_settings = [
+        {"task_name": f"test_task_{i}", "args": {"arg1": i}} for i in range(5)
+    ]
+    task_ids = db_fixture.create_tasks(queue_id=queue_id, tasks=task_settings)
+    assert len(task_ids) == 5
+
+    for i, task_id in enumerate(task_ids):
+        task = db_fixture._tasks.find_one({"_id": task_id})
+        assert task is not None
+        assert task["queue_id"] == queue_id
+        assert task["status"] == TaskState.PENDING
+        assert task["task_name"] == f"test_task_{i}"
+        assert task["args"] == {"arg1": i}
+
+    # Test 2. Empty input is a no-op
+    assert db_fixture.create_tasks(queue_id=queue_id, tasks=[]) == []
+
+    # Test 3. Invalid task setting (neither args nor cmd)
+    with pytest.raises(HTTPException) as exc:
+        db_fixture.create_tasks(queue_id=queue_id, tasks=[{"task_name": "bad"}])
+    assert exc.value.status_code == HTTP_400_BAD_REQUEST
+
+
 @pytest.mark.integration
 @pytest.mark.unit
 def test_fetch_task(db_fixture, queue_args, get_task_args):
@@ -113,6 +143,59 @@ def test_fetch_task(db_fixture, queue_args, get_task_args):
     assert task["status"] == TaskState.RUNNING
 
 
+@pytest.mark.integration
+@pytest.mark.unit
+def test_fetch_tasks(db_fixture, queue_args):
+    # Setup
+    queue_id = db_fixture.create_queue(**queue_args)
+    task_settings = [
+        {"task_name": f"test_task_{i}", "args": {"arg1": i}} for i in range(5)
+    ]
+    db_fixture.create_tasks(queue_id=queue_id, tasks=task_settings)
+
+    # Test 1. Claim a batch smaller than the queue
+    tasks = db_fixture.fetch_tasks(queue_id=queue_id, limit=3)
+    assert len(tasks) == 3
+    for task in tasks:
+        assert task["status"] == TaskState.RUNNING
+    # dispatch order: equal priority -> oldest created first
+    assert [task["task_name"] for task in tasks] == [f"test_task_{i}" for i in range(3)]
+
+    # Test 2. Claiming more than available returns the remainder
+    tasks = db_fixture.fetch_tasks(queue_id=queue_id, limit=10)
+    assert len(tasks) == 2
+
+    # Test 3. Empty queue yields an empty batch
+    assert db_fixture.fetch_tasks(queue_id=queue_id, limit=3) == []
+
+    # Test 4. Invalid limit
+    with pytest.raises(HTTPException) as exc:
+        db_fixture.fetch_tasks(queue_id=queue_id, limit=0)
+    assert exc.value.status_code == HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.integration
+@pytest.mark.unit
+def test_refresh_task_heartbeats(db_fixture, queue_args):
+    # Setup
+    queue_id = db_fixture.create_queue(**queue_args)
+    task_settings = [
+        {"task_name": f"test_task_{i}", "args": {"arg1": i}} for i in range(3)
+    ]
+    db_fixture.create_tasks(queue_id=queue_id, tasks=task_settings)
+    tasks = db_fixture.fetch_tasks(queue_id=queue_id, limit=3)
+    task_ids = [task["_id"] for task in tasks]
+
+    # Test 1. Batch refresh updates every task in one call
+    assert db_fixture.refresh_task_heartbeats(queue_id, task_ids) == 3
+
+    # Test 2. Unknown ids are skipped, not errors
+    assert db_fixture.refresh_task_heartbeats(queue_id, ["no-such-task"]) == 0
+
+    # Test 3. Empty batch is a no-op
+    assert db_fixture.refresh_task_heartbeats(queue_id, []) == 0
+
+
 @pytest.mark.integration
 @pytest.mark.unit
 def test_create_duplicate_queue(db_fixture, queue_args, monkeypatch):
@@ -192,6 +275,84 @@ def test_heartbeat_timeout(db_fixture, queue_args, get_task_args):
         assert "timed out" in task["summary"]["labtasker_error"]
 
 
+@pytest.mark.integration
+@pytest.mark.unit
+def test_timeout_with_failed_worker_report(db_fixture, queue_args, get_task_args):
+    """A failed worker report must not block the task's own transition."""
+    queue_id = db_fixture.create_queue(**queue_args)
+    task_id = db_fixture.create_task(
+        **get_task_args(
+            queue_id,
+            override_fields={
+                "heartbeat_timeout": 120,
+                "max_retries": 1,
+            },
+        )
+    )
+    worker_id = db_fixture.create_worker(queue_id=queue_id)
+
+    with freeze_time("2025-01-01 12:00:00") as frozen_time:
+        task = db_fixture.fetch_task(queue_id=queue_id, worker_id=worker_id)
+        assert task["_id"] == task_id
+
+        # Suspending the worker makes the sweep's "failed" report an invalid
+        # FSM transition (SUSPENDED -> CRASHED), so the report raises.
+        db_fixture.report_worker_status(queue_id, worker_id, "suspended")
+
+        frozen_time.tick(timedelta(seconds=121))
+        transitioned = db_fixture.handle_timeouts()
+        assert task_id in transitioned, f"Task {task_id} should be in {transitioned}"
+
+        # The task still transitioned despite the failed worker report
+        task = db_fixture._tasks.find_one({"_id": task_id})
+        assert task["status"] == TaskState.FAILED
+        assert "timed out" in task["summary"]["labtasker_error"]
+
+        # The worker is untouched: still suspended, no retries recorded
+        worker = db_fixture._workers.find_one({"_id": worker_id})
+        assert worker["status"] == WorkerState.SUSPENDED
+        assert worker["retries"] == 0
+
+
+@pytest.mark.integration
+@pytest.mark.unit
+def test_deadline_backfill_for_legacy_running_tasks(
+    db_fixture, queue_args, get_task_args
+):
+    """Running tasks from before the deadline fields must still time out."""
+    queue_id = db_fixture.create_queue(**queue_args)
+    task_id = db_fixture.create_task(
+        **get_task_args(
+            queue_id,
+            override_fields={
+                "heartbeat_timeout": 120,
+                "max_retries": 1,
+            },
+        )
+    )
+
+    with freeze_time("2025-01-01 12:00:00") as frozen_time:
+        task = db_fixture.fetch_task(queue_id=queue_id)
+        assert task["_id"] == task_id
+
+        # Simulate a document claimed by a version without deadline fields
+        db_fixture._tasks.update_one(
+            {"_id": task_id},
+            {"$unset": {"heartbeat_deadline": "", "task_deadline": ""}},
+        )
+
+        frozen_time.tick(timedelta(seconds=121))
+        # Without a backfill the sweep cannot see the legacy document
+        assert db_fixture.handle_timeouts() == []
+
+        db_fixture._backfill_task_deadlines()
+        transitioned = db_fixture.handle_timeouts()
+        assert task_id in transitioned, f"Task {task_id} should be in {transitioned}"
+
+        task = db_fixture._tasks.find_one({"_id": task_id})
+        assert task["status"] == TaskState.FAILED
+
+
 @pytest.mark.integration
 @pytest.mark.unit
 def test_task_retry_on_timeout(db_fixture, queue_args, get_task_args):
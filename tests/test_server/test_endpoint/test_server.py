@@ -19,6 +19,8 @@ from labtasker.api_models import (
     QueueCreateResponse,
     QueueGetResponse,
     Task,
+    TaskBatchSubmitRequest,
+    TaskBatchSubmitResponse,
     TaskFetchRequest,
     TaskFetchResponse,
     TaskLsRequest,
@@ -220,6 +222,41 @@ class TestTaskEndpoints:
         data = TaskSubmitResponse(**response.json())
         assert data.task_id is not None
 
+    def test_submit_tasks_batch(self, test_app, setup_queue, auth_headers):
+        batch = TaskBatchSubmitRequest(
+            tasks=[
+                TaskSubmitRequest(task_name=f"test_task_{i}", args={"arg1": i})
+                for i in range(5)
+            ]
+        )
+        response = test_app.post(
+            "/api/v1/queues/me/tasks/batch",
+            json=batch.model_dump(),
+            headers=auth_headers,
+        )
+        assert response.status_code == HTTP_201_CREATED, f"{response.json()}"
+        data = TaskBatchSubmitResponse(**response.json())
+        assert len(data.task_ids) == 5
+
+        # Submitted tasks are fetchable
+        response = test_app.post(
+            "/api/v1/queues/me/tasks/next",
+            headers=auth_headers,
+            json=TaskFetchRequest(start_heartbeat=True).model_dump(),
+        )
+        assert response.status_code == HTTP_200_OK, f"{response.json()}"
+        task = TaskFetchResponse(**response.json())
+        assert task.found is True
+        assert task.task.task_id in data.task_ids
+
+        # Empty batch is rejected by request validation
+        response = test_app.post(
+            "/api/v1/queues/me/tasks/batch",
+            json={"tasks": []},
+            headers=auth_headers,
+        )
+        assert response.status_code == HTTP_422_UNPROCESSABLE_ENTITY
+
     def test_fetch_task(self, test_app, setup_queue, auth_headers, task_submit_request):
         # Submit a task first
         response = test_app.post(